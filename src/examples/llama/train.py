@@ -8,7 +8,7 @@ Launch this with torchrun:
 
 import sys
 from dataclasses import dataclass
-from typing import List, cast
+from typing import List, Optional, cast
 
 from olmo_core.config import Config, DType
 from olmo_core.data import (
@@ -18,9 +18,17 @@ from olmo_core.data import (
     TokenizerConfig,
 )
 from olmo_core.distributed.parallel import DataParallelType
-from olmo_core.nn.transformer import TransformerConfig, TransformerDataParallelConfig
+from olmo_core.distributed.utils import get_rank, scatter_object
+from olmo_core.exceptions import OLMoConfigurationError
+from olmo_core.nn.transformer import (
+    TransformerActivationCheckpointingConfig,
+    TransformerActivationCheckpointingMode,
+    TransformerConfig,
+    TransformerDataParallelConfig,
+)
 from olmo_core.optim import AdamWConfig, CosWithWarmup, OptimGroupOverride
 from olmo_core.train import (
+    CheckpointerConfig,
     Duration,
     TrainerConfig,
     prepare_training_environment,
@@ -63,6 +71,11 @@ def build_config(run_name: str, overrides: List[str]) -> ExperimentConfig:
         dp_config=TransformerDataParallelConfig(
             name=DataParallelType.fsdp, param_dtype=DType.bfloat16, reduce_dtype=DType.float32
         ),
+        # Recompute block activations in the backward pass to free up memory for bigger micro-batches.
+        # Override with '--model.ac_config=null' to disable.
+        ac_config=TransformerActivationCheckpointingConfig(
+            mode=TransformerActivationCheckpointingMode.full
+        ),
     )
 
     optim_config = AdamWConfig(
@@ -70,6 +83,7 @@ def build_config(run_name: str, overrides: List[str]) -> ExperimentConfig:
         group_overrides=[
             OptimGroupOverride(params=["embeddings.weight"], opts=dict(weight_decay=0.0))
         ],
+        fused=True,
     )
 
     dataset_config = NumpyDatasetConfig.glob(
@@ -89,15 +103,22 @@ def build_config(run_name: str, overrides: List[str]) -> ExperimentConfig:
         global_batch_size=256 * 1024,
         seed=0,
         num_workers=4,
+        # Keep a few batches queued up per worker so that batch assembly overlaps with training.
+        prefetch_factor=4,
     )
 
     trainer_config = (
         TrainerConfig(
             save_folder=f"/tmp/{run_name}",
-            rank_microbatch_size=16 * 1024,
+            rank_microbatch_size=32 * 1024,
             save_overwrite=True,
+            # Stage async checkpoints in pinned memory to minimize the pause from each save.
+            checkpointer=CheckpointerConfig(pin_memory=True),
             metrics_collect_interval=5,
             cancel_check_interval=5,
+            # Only reduce-scatter gradients once per batch, this model is small enough that
+            # accumulating unsharded gradients is cheap.
+            defer_fsdp_grad_sync=True,
             load_key_mapping={
                 # For backwards compatibility when loading older checkpoints.
                 "lm_head.w_out.weight": "w_out.weight",
@@ -138,7 +159,9 @@ def build_config(run_name: str, overrides: List[str]) -> ExperimentConfig:
             ),
         )
         .with_callback("config_saver", ConfigSaverCallback())
-        .with_callback("profiler", ProfilerCallback(enabled=False))
+        .with_callback(
+            "profiler", ProfilerCallback(enabled=False, wait=5, warmup=2, active=3, repeat=1)
+        )
         .with_callback(
             "lm_evaluator",
             LMEvaluatorCallbackConfig(
@@ -174,7 +197,23 @@ def build_config(run_name: str, overrides: List[str]) -> ExperimentConfig:
 
 
 def main(run_name: str, overrides: List[str]):
-    config = build_config(run_name, overrides)
+    # Build and merge the config once on rank 0 and share it with the other ranks. This avoids
+    # redundant parsing and guarantees that every rank trains with an identical config.
+    # If that fails on rank 0 (e.g. because of a bad override) we share the error too, otherwise
+    # the other ranks would hang until the process group times out.
+    config: Optional[ExperimentConfig] = None
+    error: Optional[str] = None
+    if get_rank() == 0:
+        try:
+            config = build_config(run_name, overrides)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            scatter_object((None, error))
+            raise
+    config, error = scatter_object((config, error))
+    if error is not None:
+        raise OLMoConfigurationError(f"Failed to build config on rank 0. {error}")
+    assert config is not None
 
     # Set RNG states on all devices.
     seed_all(config.init_seed)
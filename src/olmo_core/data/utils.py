@@ -1,7 +1,10 @@
 import gzip
+import logging
 import math
 import os
 import random
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
@@ -25,6 +28,15 @@ from olmo_core.aliases import PathOrStr
 from olmo_core.io import add_cached_path_clients, get_bytes_range, is_url, resource_path
 from olmo_core.utils import capped_powers_of_2
 
+log = logging.getLogger(__name__)
+
+OLMO_MEMMAP_CACHE_SIZE_ENV_VAR = "OLMO_MEMMAP_CACHE_SIZE"
+"""
+Environment variable for the maximum number of local files that :func:`load_array_slice()` keeps
+memory-mapped per process. Set it to at least the number of files a dataset reads from to avoid
+re-mapping files on every read, or to ``0`` to disable memory-mapping altogether.
+"""
+
 
 def split_batch(batch: Dict[str, Any], num_microbatch_instances: int) -> List[Dict[str, Any]]:
     """
@@ -226,6 +238,13 @@ def load_array_slice(
     :param end_idx: The end index (0-based, exclusive) of the slice within the array.
     :param dtype: The numpy datatype of the array.
     """
+    if not is_url(path) and (cache_size := _get_memmap_cache_size()) > 0:
+        # For local files we read through a cached memory map, which avoids opening the file
+        # for every slice and lets the OS page cache serve hot ranges.
+        mmap = _get_memmap(str(path), dtype, cache_size)
+        if mmap is not None:
+            return np.array(mmap[start_idx:end_idx])
+
     item_size = dtype(0).itemsize
     bytes_start = start_idx * item_size
     num_bytes = (end_idx - start_idx) * item_size
@@ -233,6 +252,56 @@ def load_array_slice(
     return np.frombuffer(buffer, dtype=dtype)
 
 
+_DEFAULT_MEMMAP_CACHE_SIZE = 256
+_MEMMAP_CACHE: "OrderedDict[str, Tuple[int, int, Type[np.generic], Optional[np.memmap]]]" = (
+    OrderedDict()
+)
+_MEMMAP_CACHE_LOCK = threading.Lock()
+_MEMMAP_CACHE_EVICTION_WARNED = False
+
+
+def _get_memmap_cache_size() -> int:
+    # NOTE: this is read from the environment, instead of a module global, so that it also applies
+    # in data loader worker processes started with "spawn".
+    return int(os.environ.get(OLMO_MEMMAP_CACHE_SIZE_ENV_VAR, _DEFAULT_MEMMAP_CACHE_SIZE))
+
+
+def _get_memmap(path: str, dtype: Type[np.generic], cache_size: int) -> Optional[np.memmap]:
+    global _MEMMAP_CACHE_EVICTION_WARNED
+
+    # NOTE: the cache is keyed on the path alone, and an entry is rebuilt whenever the file's inode
+    # or modification time changes. That way a replaced file, like the global indices files that
+    # get rewritten each epoch, evicts its stale map instead of leaving it pinned in the cache.
+    stat = os.stat(path)
+    with _MEMMAP_CACHE_LOCK:
+        entry = _MEMMAP_CACHE.get(path)
+        if entry is not None and entry[:3] == (stat.st_ino, stat.st_mtime_ns, dtype):
+            _MEMMAP_CACHE.move_to_end(path)
+            return entry[3]
+
+    mmap: Optional[np.memmap] = None
+    if stat.st_size > 0:
+        try:
+            mmap = np.memmap(path, mode="r", dtype=dtype)
+        except ValueError:
+            # The file size isn't a multiple of the item size, so we can't map the whole thing.
+            # Callers fall back to reading byte ranges instead.
+            mmap = None
+
+    with _MEMMAP_CACHE_LOCK:
+        _MEMMAP_CACHE[path] = (stat.st_ino, stat.st_mtime_ns, dtype, mmap)
+        _MEMMAP_CACHE.move_to_end(path)
+        while len(_MEMMAP_CACHE) > cache_size:
+            _MEMMAP_CACHE.popitem(last=False)
+            if not _MEMMAP_CACHE_EVICTION_WARNED:
+                _MEMMAP_CACHE_EVICTION_WARNED = True
+                log.warning(
+                    f"Reading from more than {cache_size} local files, so memory maps are being "
+                    f"evicted and re-opened. Consider raising '{OLMO_MEMMAP_CACHE_SIZE_ENV_VAR}'."
+                )
+    return mmap
+
+
 def load_array_slice_into_tensor(
     path: PathOrStr,
     start_idx: int,
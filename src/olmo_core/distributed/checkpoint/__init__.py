@@ -39,6 +39,7 @@ import torch.nn as nn
 from rich.progress import track
 from torch.distributed.checkpoint.default_planner import DefaultSavePlanner
 from torch.distributed.checkpoint.metadata import Metadata, TensorStorageMetadata
+from torch.distributed.checkpoint.staging import AsyncStager
 
 from olmo_core.aliases import PathOrStr
 from olmo_core.config import StrEnum
@@ -46,7 +47,11 @@ from olmo_core.io import clear_directory, dir_is_empty, is_url, normalize_path
 from olmo_core.utils import gc_cuda, get_element_size, wait_for
 
 from ..utils import barrier, get_fs_local_rank, is_distributed
-from .filesystem import RemoteFileSystemReader, RemoteFileSystemWriter
+from .filesystem import (
+    RemoteFileSystemReader,
+    RemoteFileSystemWriter,
+    StagingRemoteFileSystemWriter,
+)
 
 __all__ = [
     "save_state_dict",
@@ -166,23 +171,45 @@ def async_save_model_and_optim_state(
     save_overwrite: bool = False,
     thread_count: Optional[int] = None,
     throttle_uploads: bool = False,
+    stager: Optional[AsyncStager] = None,
 ) -> Future[None]:
     """
     An async version of :func:`save_model_and_optim_state()`.
 
     This code first de-stages the state dict on the CPU, then writes it in a separate thread.
+
+    :param stager: An optional stager to use for copying the state dict to the CPU. For example,
+        a :class:`~torch.distributed.checkpoint.staging.BlockingAsyncStager` with
+        ``cache_staged_state_dict=True`` will stage into a pinned memory buffer that gets reused
+        across calls when you pass the same stager each time. The stager receives the state dict
+        directly from the device, so it does the only device-to-host copy.
     """
     dir = _prepare_env_for_save(dir, process_group=process_group, save_overwrite=save_overwrite)
-    state_dict = _prepare_state_dict(model, optim=optim, process_group=process_group)
+    # NOTE: when a stager is given we leave the state dict on the device and let the stager do the
+    # copy to the CPU, otherwise we'd just end up copying everything to the CPU twice.
+    state_dict = _prepare_state_dict(
+        model, optim=optim, process_group=process_group, cpu_offload=stager is None
+    )
     planner = DefaultSavePlanner(dedup_save_to_lowest_rank=True)
-    return dist_cp.state_dict_saver.async_save(
-        state_dict,
-        storage_writer=RemoteFileSystemWriter(
+    storage_writer: RemoteFileSystemWriter
+    if stager is not None:
+        storage_writer = StagingRemoteFileSystemWriter(
             dir,
+            stager=stager,
             thread_count=thread_count,
             process_group=process_group,
             throttle_uploads=throttle_uploads,
-        ),
+        )
+    else:
+        storage_writer = RemoteFileSystemWriter(
+            dir,
+            thread_count=thread_count,
+            process_group=process_group,
+            throttle_uploads=throttle_uploads,
+        )
+    return dist_cp.state_dict_saver.async_save(
+        state_dict,
+        storage_writer=storage_writer,
         process_group=process_group,
         planner=planner,
     )
@@ -606,9 +633,10 @@ def _prepare_state_dict(
     model: nn.Module,
     optim: Optional[torch.optim.Optimizer] = None,
     process_group: Optional[dist.ProcessGroup] = None,
+    cpu_offload: bool = True,
 ) -> Dict[str, Any]:
     del process_group  # I feel like these torch functions should take a process group argument.
-    sd_options = dist_cp_sd.StateDictOptions(full_state_dict=False, cpu_offload=True)
+    sd_options = dist_cp_sd.StateDictOptions(full_state_dict=False, cpu_offload=cpu_offload)
 
     state_dict: Dict[str, Any] = {
         "model": dist_cp_sd.get_model_state_dict(model, options=sd_options)
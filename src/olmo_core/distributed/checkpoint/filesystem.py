@@ -9,7 +9,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 import torch
 import torch.distributed as dist
@@ -24,6 +24,7 @@ from torch.distributed.checkpoint.planner import (
     WriteItem,
     WriteItemType,
 )
+from torch.distributed.checkpoint.staging import AsyncStager
 from torch.futures import Future
 
 from olmo_core.aliases import PathOrStr
@@ -288,6 +289,31 @@ class RemoteFileSystemWriter(dist_cp.StorageWriter):
         return True
 
 
+class StagingRemoteFileSystemWriter(RemoteFileSystemWriter, AsyncStager):
+    """
+    A :class:`RemoteFileSystemWriter` that delegates staging of the state dict (copying it off of
+    the GPU before it's written asynchronously) to the given ``stager``.
+
+    This allows a single stager, such as a
+    :class:`~torch.distributed.checkpoint.staging.BlockingAsyncStager` which caches the staged
+    state dict in pinned memory, to be reused across checkpoints.
+    """
+
+    def __init__(self, path: PathOrStr, *, stager: AsyncStager, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.stager = stager
+
+    @property
+    def should_synchronize_after_execute(self) -> bool:
+        return self.stager.should_synchronize_after_execute
+
+    def stage(self, state_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return self.stager.stage(state_dict)
+
+    def synchronize_staging(self) -> None:
+        self.stager.synchronize_staging()
+
+
 class RemoteFileSystemReader(dist_cp.StorageReader):
     """
     A :class:`~torch.distributed.checkpoint.StorageReader` based on :class:`~torch.distributed.checkpoint.FileSystemReader`
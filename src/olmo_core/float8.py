@@ -126,6 +126,8 @@ class Float8Config(Config):
     :param precompute_float8_dynamic_scale_for_fsdp: Communicate AMAX/scales efficiently in a single
         all-reduce for all parameters instead of doing many small all-reduce for each parameter.
     :param compile: If using ``torch.compile``.
+    :param modules_to_ignore: Fully qualified names of linear layers to leave in high precision,
+        such as layers with GEMMs that are too small to benefit from Float8.
     :param enabled: If ``False`` this will be a no-op.
     """
 
@@ -135,6 +137,7 @@ class Float8Config(Config):
     enable_fsdp_float8_all_gather: bool = True
     precompute_float8_dynamic_scale_for_fsdp: bool = True
     compile: Optional[bool] = None
+    modules_to_ignore: Optional[List[str]] = None
     enabled: bool = True
 
     @property
@@ -182,10 +185,17 @@ class Float8Config(Config):
             builder (:class:`~olmo_core.nn.transformer.TransformerConfig`) will call this
             automatically from :meth:`~olmo_core.nn.transformer.TransformerConfig.build()` if
             the :data:`~olmo_core.nn.transformer.TransformerConfig.float8_config` field is set.
+
+        :param model: The model to convert.
+        :param modules_to_ignore: Fully qualified names of linear layers to skip, in addition to
+            those in :data:`modules_to_ignore`.
         """
         if not self.enabled:
             return
 
+        if self.modules_to_ignore:
+            modules_to_ignore = set(self.modules_to_ignore) | (modules_to_ignore or set())
+
         from torchao.float8 import convert_to_float8_training  # type: ignore
 
         ignored_modules_found = set()
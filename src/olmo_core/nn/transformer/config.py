@@ -1,6 +1,7 @@
 import logging
+import math
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import torch
 from torch.distributed import DeviceMesh
@@ -63,7 +64,9 @@ class TransformerActivationCheckpointingConfig(Config):
 
     block_interval: Optional[int] = None
     """
-    Required when :data:`mode` is "selected_blocks". Determines which blocks are wrapped.
+    Used when :data:`mode` is "selected_blocks". Determines which blocks are wrapped.
+    If not set this defaults to ``round(sqrt(n_layers))``, so that about ``sqrt(n_layers)``
+    blocks are wrapped, which is a middle ground between memory savings and recomputation overhead.
     """
 
     modules: Optional[List[str]] = None
@@ -74,13 +77,6 @@ class TransformerActivationCheckpointingConfig(Config):
 
     def __post_init__(self):
         if (
-            self.mode == TransformerActivationCheckpointingMode.selected_blocks
-            and self.block_interval is None
-        ):
-            raise OLMoConfigurationError(
-                "'block_interval' is required for 'selected_blocks' activation checkpointing"
-            )
-        elif (
             self.mode == TransformerActivationCheckpointingMode.selected_modules
             and self.modules is None
         ):
@@ -112,6 +108,12 @@ class TransformerConfig(Config):
 
     :param name: The name of the implementation.
     :param compile: Whether to compile the model with ``torch.compile``.
+    :param compile_mode: The ``torch.compile`` mode to use when ``compile=True``, e.g. "reduce-overhead"
+        to capture CUDA graphs. Note that CUDA graphs generally aren't compatible with FSDP/DDP
+        wrapping or variable sequence lengths, so this mode is only useful for runs without
+        data parallelism.
+    :param compile_fullgraph: Compile each block with ``fullgraph=True`` when ``compile=True``,
+        which raises an error on graph breaks instead of silently falling back to eager mode.
     :param dp_config: Data parallel configuration.
     :param tp_config: Tensor parallel configuration.
     :param ac_config: Activation checkpointing configuration.
@@ -130,6 +132,8 @@ class TransformerConfig(Config):
     init_method: InitMethod = InitMethod.normal
     init_seed: int = 0
     compile: bool = False
+    compile_mode: Optional[str] = None
+    compile_fullgraph: bool = False
     dp_config: Optional[TransformerDataParallelConfig] = None
     tp_config: Optional[TensorParallelConfig] = None
     ac_config: Optional[TransformerActivationCheckpointingConfig] = None
@@ -138,7 +142,7 @@ class TransformerConfig(Config):
     def build(
         self,
         *,
-        init_device: str = "cpu",
+        init_device: Optional[str] = None,
         device: Optional[torch.device] = None,
         mesh: Optional[DeviceMesh] = None,
         dp_mesh: Optional[DeviceMesh] = None,
@@ -154,7 +158,9 @@ class TransformerConfig(Config):
             parallel strategies.
 
         :param init_device: The device to put the parameters on during initialization. In a
-            distributed setting it usually makes sense to set this to "meta".
+            distributed setting it usually makes sense to set this to "meta". Defaults to "meta"
+            when using FSDP/HSDP, so that the full unsharded model is never materialized,
+            and "cpu" otherwise.
         :param device: The device to put the model on after initialization.
         :param mesh: The device mesh created from :meth:`build_mesh`. Alternatively you can provide
             `the `dp_mesh`` and ``tp_mesh`` sub-meshes separately.
@@ -163,36 +169,82 @@ class TransformerConfig(Config):
         :param max_seq_len: The maximum sequence length expected.
         """
         device = device or get_default_device()
+        if init_device is None:
+            if self.dp_config is not None and self.dp_config.name in (
+                DataParallelType.fsdp,
+                DataParallelType.hsdp,
+            ):
+                init_device = "meta"
+            else:
+                init_device = "cpu"
+
+        # Check for invalid options before doing any expensive work.
+        if self.tp_config is not None:
+            if mesh is None and tp_mesh is None:
+                raise RuntimeError(
+                    "'tp_mesh' must be provided to use tensor parallelism. "
+                    "Please use 'olmo_core.distributed.parallel.build_device_mesh()' to create it."
+                )
+            if self.name == TransformerType.normalized:
+                raise OLMoConfigurationError(
+                    "Tensor parallelism is not implemented yet for the normalized transformer"
+                )
+            if self.block.name not in (
+                TransformerBlockType.default,
+                TransformerBlockType.reordered_norm,
+            ):
+                raise OLMoConfigurationError(
+                    f"Tensor parallelism is not implemented yet for the '{self.block.name}' block"
+                )
+
+        # Resolve the device meshes up front too, so that a data parallel config that can't be
+        # satisfied fails before the model is built.
+        if tp_mesh is None and mesh is not None:
+            tp_mesh = get_tp_mesh(mesh)
+
+        if dp_mesh is None and mesh is not None:
+            dp_mesh = get_dp_mesh(mesh)
+        elif (
+            dp_mesh is None
+            and self.dp_config is not None
+            and self.dp_config.name == DataParallelType.hsdp
+        ):
+            # HSDP needs a 2D mesh, so we have to build one if the caller didn't provide it.
+            dp_mesh = self.dp_config.build_device_mesh(device_type=device.type)
+
+        if (
+            self.dp_config is not None
+            and self.dp_config.name == DataParallelType.hsdp
+            and (dp_mesh is None or dp_mesh.ndim != 2)
+        ):
+            raise OLMoConfigurationError(
+                "HSDP requires a 2D data parallel mesh with replicate and shard dimensions"
+            )
 
+        # NOTE: 'num_params' walks the whole config tree, so only compute it once.
+        num_params = self.num_params
+        num_non_embedding_params = self._num_non_embedding_params(num_params)
         log.info(
-            f"Building transformer with {self.num_params:,d} total params, "
-            f"{self.num_non_embedding_params:,d} non-embedding params"
+            f"Building transformer with {num_params:,d} total params, "
+            f"{num_non_embedding_params:,d} non-embedding params"
+        )
+        kwargs: Dict[str, Any] = dict(
+            d_model=self.d_model,
+            vocab_size=self.vocab_size,
+            n_layers=self.n_layers,
+            block=self.block,
+            lm_head=self.lm_head,
+            dtype=self.dtype.as_pt(),
+            init_method=self.init_method,
+            init_device=init_device,
+            init_seed=self.init_seed,
         )
+
         model: Transformer
         if self.name == TransformerType.default:
-            model = Transformer(
-                d_model=self.d_model,
-                vocab_size=self.vocab_size,
-                n_layers=self.n_layers,
-                block=self.block,
-                lm_head=self.lm_head,
-                dtype=self.dtype.as_pt(),
-                init_method=self.init_method,
-                init_device=init_device,
-                init_seed=self.init_seed,
-            )
+            model = Transformer(**kwargs)
         elif self.name == TransformerType.normalized:
-            model = NormalizedTransformer(
-                d_model=self.d_model,
-                vocab_size=self.vocab_size,
-                n_layers=self.n_layers,
-                block=self.block,
-                lm_head=self.lm_head,
-                dtype=self.dtype.as_pt(),
-                init_method=self.init_method,
-                init_device=init_device,
-                init_seed=self.init_seed,
-            )
+            model = NormalizedTransformer(**kwargs)
         else:
             raise NotImplementedError(self.name)
 
@@ -207,14 +259,6 @@ class TransformerConfig(Config):
         log.info("%s", model)
 
         # Maybe apply tensor parallelism.
-        if self.tp_config is not None and mesh is None and tp_mesh is None:
-            raise RuntimeError(
-                "'tp_mesh' must be provided to use tensor parallelism. "
-                "Please use 'olmo_core.distributed.parallel.build_device_mesh()' to create it."
-            )
-        elif tp_mesh is None and mesh is not None:
-            tp_mesh = get_tp_mesh(mesh)
-
         if tp_mesh is not None:
             model.apply_tp(
                 tp_mesh,
@@ -226,36 +270,40 @@ class TransformerConfig(Config):
 
         # Maybe apply activation checkpointing.
         if self.ac_config is not None:
+            block_interval = self.ac_config.block_interval
+            if (
+                self.ac_config.mode == TransformerActivationCheckpointingMode.selected_blocks
+                and block_interval is None
+            ):
+                block_interval = max(1, round(math.sqrt(self.n_layers)))
             model.apply_activation_checkpointing(
                 self.ac_config.mode,
-                block_interval=self.ac_config.block_interval,
+                block_interval=block_interval,
                 modules=self.ac_config.modules,
             )
 
         # Maybe compile.
         if self.compile:
             if torch.cuda.is_available():
-                model.apply_compile()
+                model.apply_compile(mode=self.compile_mode, fullgraph=self.compile_fullgraph)
             else:
                 log.warning(
                     "model.compile was set to True, but CUDA is not available. Compiling only works with CUDA. Ignoring."
                 )
 
         # Maybe wrap for data parallel.
-        if dp_mesh is None and mesh is not None:
-            dp_mesh = get_dp_mesh(mesh)
-
         if self.dp_config is not None:
             if self.dp_config.name in (DataParallelType.fsdp, DataParallelType.hsdp):
-                if self.dp_config.name == DataParallelType.hsdp and dp_mesh is None:
-                    dp_mesh = self.dp_config.build_device_mesh(device_type=device.type)
-
+                param_dtype = (
+                    None
+                    if self.dp_config.param_dtype is None
+                    else self.dp_config.param_dtype.as_pt()
+                )
+                reduce_dtype = self.dp_config.reduce_dtype.as_pt()
                 model.apply_fsdp(
                     dp_mesh=dp_mesh,
-                    param_dtype=self.dp_config.param_dtype.as_pt()
-                    if self.dp_config.param_dtype is not None
-                    else None,
-                    reduce_dtype=self.dp_config.reduce_dtype.as_pt(),
+                    param_dtype=param_dtype,
+                    reduce_dtype=reduce_dtype,
                     wrapping_strategy=self.dp_config.wrapping_strategy,
                 )
             elif self.dp_config.name == DataParallelType.ddp:
@@ -298,19 +346,15 @@ class TransformerConfig(Config):
         # Block attention params.
         block_params += self.block.attention.num_params(self.d_model)
 
-        # Block attention norm.
-        if self.block.layer_norm is not None:
-            block_params += self.block.layer_norm.num_params(self.d_model)
-
         # Block feed forward.
         if self.block.feed_forward is not None:
             block_params += self.block.feed_forward.num_params(self.d_model)
         elif self.block.feed_forward_moe is not None:
             block_params += self.block.feed_forward_moe.num_params(self.d_model)
 
-        # Block feed forward norm.
+        # Block attention norm and feed forward norm, which share the same config.
         if self.block.layer_norm is not None:
-            block_params += self.block.layer_norm.num_params(self.d_model)
+            block_params += 2 * self.block.layer_norm.num_params(self.d_model)
 
         # All block params.
         num_params += self.n_layers * block_params
@@ -325,7 +369,10 @@ class TransformerConfig(Config):
         """
         The number of parameters excluding embedding parameters.
         """
-        return self.num_params - self.d_model * self.vocab_size
+        return self._num_non_embedding_params(self.num_params)
+
+    def _num_non_embedding_params(self, num_params: int) -> int:
+        return num_params - self.d_model * self.vocab_size
 
     def num_flops_per_token(self, seq_len: int) -> int:
         """
@@ -725,14 +772,14 @@ class TransformerConfig(Config):
             use_flash = False if compile else has_flash_attn()
 
         # Resolve hidden size of FFN in blocks.
-        hidden_size = int(8 * d_model / 3)
-        if hidden_size_multiplier is not None:
-            hidden_size = int(hidden_size_multiplier * hidden_size)
-        hidden_size = hidden_size_multiple_of * (
-            (hidden_size + hidden_size_multiple_of - 1) // hidden_size_multiple_of
+        hidden_size = _get_ffn_hidden_size(
+            d_model,
+            hidden_size_multiplier=hidden_size_multiplier,
+            hidden_size_multiple_of=hidden_size_multiple_of,
         )
 
-        # Configure global layer norm.
+        # Configure global layer norm. Each consumer gets its own copy so that modifying one
+        # (e.g. 'config.lm_head.layer_norm') doesn't silently modify the others.
         layer_norm = LayerNormConfig(
             name=LayerNormType.fused_rms if fused_ops else LayerNormType.rms,
             eps=layer_norm_eps,
@@ -757,7 +804,7 @@ class TransformerConfig(Config):
                 n_kv_heads=n_kv_heads,
                 bias=False,
                 rope=RoPEConfig(name=rope_type, theta=rope_theta, scaling=rope_scaling),
-                qk_norm=layer_norm if qk_norm else None,
+                qk_norm=layer_norm.replace() if qk_norm else None,
                 use_flash=use_flash,
                 dtype=dtype,
             ),
@@ -770,7 +817,7 @@ class TransformerConfig(Config):
             vocab_size=vocab_size,
             n_layers=n_layers,
             block=block,
-            lm_head=LMHeadConfig(layer_norm=layer_norm, bias=False, dtype=dtype),
+            lm_head=LMHeadConfig(layer_norm=layer_norm.replace(), bias=False, dtype=dtype),
             dtype=dtype,
             compile=compile,
             **kwargs,
@@ -801,11 +848,10 @@ class TransformerConfig(Config):
             use_flash = False if compile else has_flash_attn()
 
         # Resolve hidden size of FFN in blocks.
-        hidden_size = int(8 * d_model / 3)
-        if hidden_size_multiplier is not None:
-            hidden_size = int(hidden_size_multiplier * hidden_size)
-        hidden_size = hidden_size_multiple_of * (
-            (hidden_size + hidden_size_multiple_of - 1) // hidden_size_multiple_of
+        hidden_size = _get_ffn_hidden_size(
+            d_model,
+            hidden_size_multiplier=hidden_size_multiplier,
+            hidden_size_multiple_of=hidden_size_multiple_of,
         )
 
         # Configure blocks.
@@ -837,3 +883,16 @@ class TransformerConfig(Config):
             init_method=InitMethod.normalized,
             **kwargs,
         )
+
+
+def _get_ffn_hidden_size(
+    d_model: int, *, hidden_size_multiplier: Optional[float], hidden_size_multiple_of: int
+) -> int:
+    # Start from 2/3 of 4 * d_model, computed with integer math to avoid float rounding.
+    hidden_size = (8 * d_model) // 3
+    if hidden_size_multiplier is not None:
+        hidden_size = int(hidden_size_multiplier * hidden_size)
+    # Round up to the nearest multiple of 'hidden_size_multiple_of'.
+    return hidden_size_multiple_of * (
+        (hidden_size + hidden_size_multiple_of - 1) // hidden_size_multiple_of
+    )
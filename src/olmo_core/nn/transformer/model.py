@@ -346,7 +346,7 @@ class Transformer(nn.Module):
 
         log.info(f"Applied {mode} activation checkpointing to the model")
 
-    def apply_compile(self):
+    def apply_compile(self, mode: Optional[str] = None, fullgraph: bool = False):
         """
         Apply ``torch.compile()`` to each transformer block, which makes compilation efficient
         due to repeated structure.
@@ -357,14 +357,19 @@ class Transformer(nn.Module):
 
             If you do use this directly note that it must be called after
             :meth:`apply_activation_checkpointing()` but before :meth:`apply_fsdp()` or :meth:`apply_ddp()`.
+
+        :param mode: The compilation mode to pass to ``torch.compile()``, e.g. "reduce-overhead"
+            to use CUDA graphs.
+        :param fullgraph: Require each block to compile into a single graph, raising an error
+            on any graph break.
         """
         for block_id, block in self.blocks.named_children():
-            block = torch.compile(block, fullgraph=False)
+            block = torch.compile(block, fullgraph=fullgraph, mode=mode)
             self.blocks.register_module(block_id, block)  # type: ignore
 
-        self.register_module("lm_head", torch.compile(self.lm_head, fullgraph=False))  # type: ignore
+        self.register_module("lm_head", torch.compile(self.lm_head, fullgraph=fullgraph, mode=mode))  # type: ignore
 
-        log.info("Compiling each transformer block with torch.compile")
+        log.info(f"Compiling each transformer block with torch.compile (mode={mode or 'default'})")
 
     def apply_fsdp(
         self,
@@ -563,6 +568,6 @@ class NormalizedTransformer(Transformer):
             "TP is not implemented yet for the normalized transformer variant"
         )
 
-    def apply_compile(self):
-        super().apply_compile()
+    def apply_compile(self, mode: Optional[str] = None, fullgraph: bool = False):
+        super().apply_compile(mode=mode, fullgraph=fullgraph)
         self.normalize_matrices = torch.compile(self.normalize_matrices)
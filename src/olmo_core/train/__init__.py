@@ -49,7 +49,13 @@ import torch.multiprocessing as mp
 
 from ..distributed.utils import init_distributed, is_distributed
 from ..io import add_cached_path_clients
-from ..utils import LogFilterType, get_default_device, prepare_cli_environment, seed_all
+from ..utils import (
+    LogFilterType,
+    get_default_device,
+    prepare_cli_environment,
+    seed_all,
+    set_env_var,
+)
 from .checkpoint import Checkpointer, CheckpointerConfig
 from .common import Duration, DurationUnit, LoadStrategy, ReduceType
 from .config import TrainerConfig
@@ -78,6 +84,7 @@ def prepare_training_environment(
     backend: Optional[str] = "cpu:gloo,cuda:nccl",
     timeout: timedelta = timedelta(minutes=30),
     log_filter_type: Optional[LogFilterType] = None,
+    allow_tf32: bool = True,
 ):
     """
     Prepare the environment for training, including setting up the distributed process group
@@ -108,6 +115,9 @@ def prepare_training_environment(
 
         .. note::
             All ranks will always emit messages at the ``WARNING`` level or higher.
+    :param allow_tf32: Allow TensorFloat-32 tensor cores to be used for float32 matrix multiplications
+        and convolutions. This only affects operations that run in float32, such as those outside of
+        autocast or mixed precision regions. Set this to ``False`` to force full float32 precision.
     """
     # Setting the mp start method to "spawn" avoids some data loader segfaults on LUMI.
     try:
@@ -115,6 +125,11 @@ def prepare_training_environment(
     except RuntimeError as e:
         print(f"failed to set multiprocessing start method: {e}")
 
+    # Let the CUDA caching allocator grow existing segments instead of allocating new ones,
+    # which reduces fragmentation when tensor shapes vary from batch to batch.
+    # NOTE: this needs to be set before the first CUDA allocation.
+    set_env_var("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
     # Initialize process group.
     if backend is not None:
         init_distributed(backend=backend, timeout=timeout)
@@ -127,6 +142,10 @@ def prepare_training_environment(
     # Add custom cached-path clients.
     add_cached_path_clients()
 
+    # Configure matmul precision.
+    torch.set_float32_matmul_precision("high" if allow_tf32 else "highest")
+    torch.backends.cudnn.allow_tf32 = allow_tf32
+
     # Init RNG states.
     if seed is not None:
         seed_all(seed)
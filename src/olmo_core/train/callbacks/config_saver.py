@@ -16,6 +16,9 @@ class ConfigSaverCallback(Callback):
     """
     A callback that writes an arbitrary JSON-serializable config dictionary to every checkpoint
     directory written during training.
+
+    The file is written in the background with :meth:`~olmo_core.train.Trainer.run_in_background()`
+    so that it doesn't block training.
     """
 
     config: Optional[Dict[str, Any]] = None
@@ -29,4 +32,6 @@ class ConfigSaverCallback(Callback):
             log.warning(f"Config not set on {self.__class__.__name__}, doing nothing")
             return
 
-        self.trainer.write_file(self.fname, json.dumps(self.config), dir=path)
+        self.trainer.run_in_background(
+            self.trainer.write_file, self.fname, json.dumps(self.config), dir=path
+        )
@@ -16,6 +16,12 @@ class GPUMemoryMonitorCallback(Callback):
     """
 
     device_id: Optional[int] = None
+    collect_interval: Optional[int] = None
+    """
+    How often, in steps, to collect memory statistics. Peak values are tracked over the whole
+    interval. Defaults to :data:`Trainer.metrics_collect_interval <olmo_core.train.Trainer.metrics_collect_interval>`.
+    """
+
     _num_alloc_retries: int = 0
 
     @property
@@ -42,6 +48,10 @@ class GPUMemoryMonitorCallback(Callback):
         )
 
     def post_step(self):
+        collect_interval = self.collect_interval or self.trainer.metrics_collect_interval
+        if self.step > 1 and self.step % collect_interval != 0:
+            return
+
         cuda_info = torch.cuda.memory_stats(self.device)
 
         max_active = cuda_info["active_bytes.all.peak"]
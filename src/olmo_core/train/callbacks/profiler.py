@@ -34,7 +34,9 @@ class ProfilerCallback(Callback):
     """
     repeat: int = 1
     """
-    Repeat the cycle start at ``wait`` steps.
+    Repeat the cycle start at ``wait`` steps. The profiler is shut down after the last cycle
+    completes so the rest of training runs unperturbed. Set to ``0`` to repeat the cycle until
+    training ends.
     """
     enabled: bool = True
     """
@@ -81,9 +83,22 @@ class ProfilerCallback(Callback):
 
         if self._first_batch:
             self._first_batch = False
-        else:
-            assert self._profiler is not None
+        elif self._profiler is not None:
             self._profiler.step()
+            if self.repeat > 0 and self._profiler.step_num >= self.skip_first + self.repeat * (
+                self.wait + self.warmup + self.active
+            ):
+                self._stop_profiler()
+
+    def post_train(self):
+        self._stop_profiler()
+
+    def _stop_profiler(self):
+        if self._exit_stack is not None:
+            self._exit_stack.close()
+            log.info("Profiling complete")
+        self._exit_stack = None
+        self._profiler = None
 
     def _on_trace_ready(self, prof):
         assert self._profiler is not None
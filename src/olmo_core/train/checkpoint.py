@@ -5,7 +5,7 @@ import re
 import tempfile
 from concurrent.futures import Future
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, ClassVar, Dict, Generator, Optional, Tuple, Union
 
@@ -13,6 +13,7 @@ import torch
 import torch.distributed as dist
 import torch.nn as nn
 from cached_path import cached_path
+from torch.distributed.checkpoint.staging import BlockingAsyncStager
 from torch.optim import Optimizer
 
 from ..aliases import PathOrStr
@@ -58,6 +59,7 @@ class CheckpointerConfig(Config):
     save_thread_count: Optional[int] = None
     load_thread_count: Optional[int] = None
     throttle_uploads: bool = False
+    pin_memory: bool = False
 
     def build(self, process_group: Optional[dist.ProcessGroup] = None, **kwargs) -> "Checkpointer":
         kwargs = {**self.as_dict(exclude_none=True, recurse=False), **kwargs}
@@ -88,9 +90,19 @@ class Checkpointer:
     save_thread_count: Optional[int] = None
     load_thread_count: Optional[int] = None
     throttle_uploads: bool = False
+    pin_memory: bool = False
+    """
+    Stage the state dict for async checkpoints in a pinned memory buffer that's reused across saves.
+    This makes copying the state off of the GPU faster at the expense of holding onto a CPU copy
+    of the local model and optimizer state for the duration of training.
+    """
+
+    _stager: Optional[BlockingAsyncStager] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         self.work_dir = Path(self.work_dir)
+        if self.pin_memory and not torch.cuda.is_available():
+            log.warning("'pin_memory' requires CUDA, falling back to default checkpoint staging")
         if get_fs_local_rank() == 0:
             self.work_dir.mkdir(exist_ok=True, parents=True)
 
@@ -147,6 +159,7 @@ class Checkpointer:
             save_overwrite=self.save_overwrite,
             thread_count=self.save_thread_count,
             throttle_uploads=self.throttle_uploads,
+            stager=self._get_stager(),
         )
 
         def done_callback(fut: Future):
@@ -340,6 +353,13 @@ class Checkpointer:
         else:
             return latest_checkpoint
 
+    def _get_stager(self) -> Optional[BlockingAsyncStager]:
+        if not self.pin_memory or not torch.cuda.is_available():
+            return None
+        if self._stager is None:
+            self._stager = BlockingAsyncStager(cache_staged_state_dict=True)
+        return self._stager
+
     def _save_train_state(self, dir: PathOrStr, wd: Path, train_state: Dict[str, Any]):
         train_dir = wd / "train"
         # NOTE: if 'dir' is a URL, the 'wd' will be a different temp dir for each rank.
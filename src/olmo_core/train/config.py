@@ -51,6 +51,7 @@ class TrainerConfig(Config):
     compile_loss: bool = False
     z_loss_multiplier: Optional[float] = None
     autocast_precision: Optional[DType] = None
+    defer_fsdp_grad_sync: bool = False
     async_bookkeeping: Optional[bool] = None
 
     def add_callback(self, name: str, callback: Callback):
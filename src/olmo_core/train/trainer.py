@@ -24,6 +24,7 @@ from typing import (
 import torch
 import torch.distributed as dist
 import torch.nn as nn
+from torch.distributed._composable.fsdp import FSDPModule
 from torch.nn.parallel import DistributedDataParallel as DDP
 from torch.optim import Optimizer
 
@@ -232,6 +233,17 @@ class Trainer:
     Enable AMP with this data type.
     """
 
+    defer_fsdp_grad_sync: bool = False
+    """
+    When training an FSDP(2) model with gradient accumulation, only reduce-scatter gradients
+    after the final micro-batch of each batch instead of after every micro-batch.
+    This reduces communication volume at the expense of keeping unsharded gradients in memory
+    while accumulating.
+
+    .. note::
+        DDP models always defer gradient synchronization to the final micro-batch.
+    """
+
     dp_process_group: Optional[dist.ProcessGroup] = None
     """
     The distributed process group for all data parallel ranks.
@@ -616,6 +628,10 @@ class Trainer:
         self._thread_pool = None
         barrier()
 
+        # Surface errors from background tasks that finished after the training loop.
+        if self._error is not None:
+            raise RuntimeError("An error occurred") from self._error
+
         log.info("Training complete")
 
     def state_dict(self) -> TrainerStateDict:
@@ -883,6 +899,29 @@ class Trainer:
         """
         return self.checkpointer.write_file(dir or self.save_folder, name, contents)
 
+    def run_in_background(self, op: Callable[..., T], *args, **kwargs) -> Future[T]:
+        """
+        Run ``op`` in the :data:`thread_pool` without blocking training. If ``op`` fails, the
+        error is logged and training is stopped with that error at the next opportunity,
+        the same way as for the trainer's own bookkeeping tasks.
+
+        :param op: The function to run.
+        :param args: Positional arguments to pass to ``op``.
+        :param kwargs: Keyword arguments to pass to ``op``.
+
+        :returns: The future for the result of ``op``.
+        """
+        future = self.thread_pool.submit(op, *args, **kwargs)
+
+        def callback(fut: Future[T]):
+            try:
+                fut.result()
+            except BaseException as e:
+                self._record_background_error(e)
+
+        future.add_done_callback(callback)
+        return future
+
     def persist_working_file(self, name: PathOrStr) -> PathOrStr:
         """
         Persist a file in the :data:`work_dir` by saving/uploading it to the :data:`save_folder`.
@@ -1071,8 +1110,7 @@ class Trainer:
                     try:
                         cb(fut.result())  # type: ignore[misc]
                     except BaseException as e:
-                        log.exception(e)
-                        self._error = e
+                        self._record_background_error(e)
 
                 future.add_done_callback(callback)
         else:
@@ -1080,6 +1118,10 @@ class Trainer:
             if cb is not None:
                 cb(result)
 
+    def _record_background_error(self, e: BaseException):
+        log.exception(e)
+        self._error = e
+
     def _check_if_canceled(self):
         if self._canceled:
             return
@@ -1167,6 +1209,9 @@ class Trainer:
             if isinstance(self.model, DDP) and micro_batch_idx != num_micro_batches - 1:
                 # For DDP, only sync gradients on the final micro batch.
                 stack.enter_context(self.model.no_sync())
+            elif isinstance(self.model, FSDPModule) and self.defer_fsdp_grad_sync:
+                # For FSDP, optionally only reduce-scatter gradients on the final micro batch.
+                self.model.set_requires_gradient_sync(micro_batch_idx == num_micro_batches - 1)
             yield
 
     def _train_batch(self, batch: Dict[str, Any], dry_run: bool = False):
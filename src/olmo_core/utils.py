@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import gc
 import logging
 import os
@@ -166,9 +167,11 @@ def gc_cuda():
         torch.cuda.empty_cache()
 
 
+@functools.lru_cache(maxsize=1)
 def has_flash_attn() -> bool:
     """
-    Check if flash-attn is available.
+    Check if flash-attn is available. The result is cached since a failed import has to
+    search the whole ``sys.path`` every time.
     """
     try:
         import flash_attn  # type: ignore
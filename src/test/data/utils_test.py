@@ -3,12 +3,15 @@ import pytest
 import torch
 
 from olmo_core.data.utils import (
+    OLMO_MEMMAP_CACHE_SIZE_ENV_VAR,
     bucket_documents,
     get_cumulative_document_lengths,
     get_document_lengths,
     iter_batched,
     iter_document_indices,
+    load_array_slice,
     melt_batch,
+    memmap_to_write,
     segment_documents_into_instances,
     write_document_indices,
 )
@@ -137,3 +140,40 @@ def test_bucket_documents(tmp_path):
         np.memmap(tmp_path / "buckets.npy", mode="r", dtype=np.uint32).reshape((-1, 2)).tolist()
     )
     assert buckets == [[0, 4], [4, 8], [8, 12], [13, 17], [17, 19], [19, 21]]
+
+
+def test_load_array_slice(tmp_path):
+    path = tmp_path / "data.npy"
+    with memmap_to_write(path, dtype=np.uint16, shape=(10,)) as mmap:
+        mmap[:] = np.arange(10)
+    np.testing.assert_array_equal(load_array_slice(path, 2, 5, np.uint16), np.array([2, 3, 4]))
+
+    # Replacing the file should invalidate any cached memory map.
+    with memmap_to_write(path, dtype=np.uint16, shape=(10,)) as mmap:
+        mmap[:] = np.arange(10, 20)
+    np.testing.assert_array_equal(load_array_slice(path, 2, 5, np.uint16), np.array([12, 13, 14]))
+
+
+@pytest.mark.parametrize("cache_size", [0, 1])
+def test_load_array_slice_with_small_memmap_cache(tmp_path, monkeypatch, cache_size: int):
+    monkeypatch.setenv(OLMO_MEMMAP_CACHE_SIZE_ENV_VAR, str(cache_size))
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"data{i}.npy"
+        with memmap_to_write(path, dtype=np.uint16, shape=(10,)) as mmap:
+            mmap[:] = np.arange(10 * i, 10 * (i + 1))
+        paths.append(path)
+
+    # Alternate between files so that each read evicts the other file's memory map.
+    for _ in range(2):
+        for i, path in enumerate(paths):
+            np.testing.assert_array_equal(
+                load_array_slice(path, 2, 5, np.uint16), np.arange(10 * i + 2, 10 * i + 5)
+            )
+
+
+def test_load_array_slice_with_partial_trailing_item(tmp_path):
+    path = tmp_path / "data.npy"
+    # A trailing odd byte means the file can't be memory-mapped as uint16.
+    path.write_bytes(np.arange(10, dtype=np.uint16).tobytes() + b"\x00")
+    np.testing.assert_array_equal(load_array_slice(path, 2, 5, np.uint16), np.array([2, 3, 4]))
@@ -2,7 +2,9 @@ import datetime
 import logging
 import os
 import sys
+import tempfile
 from typing import Any, Callable, Dict, Optional, Tuple
+from unittest import mock
 
 import pytest
 import torch
@@ -64,6 +66,12 @@ BACKENDS = [
 ]
 
 
+# The forkserver process is started fresh, so children forked from it don't inherit any threads,
+# locks, or CUDA state from the pytest process. Preloading torch there keeps startup nearly as
+# cheap as a plain fork.
+mp.set_forkserver_preload(["torch", "torch.distributed"])
+
+
 def get_default_device():
     if is_distributed():
         backend = dist.get_backend()
@@ -79,6 +87,24 @@ def get_default_device():
         return torch.device("cpu")
 
 
+def _resolve_backend_and_device(
+    backend: str, process_rank: int
+) -> Tuple[str, Optional[torch.device]]:
+    if backend == "nccl":
+        # Also register gloo for CPU tensors so that small CPU collectives don't have to round-trip
+        # through the GPU.
+        backend = "cuda:nccl,cpu:gloo"
+
+    # NOTE: Only NCCL needs a CUDA device. We set it before initializing the process group so that
+    # NCCL doesn't have to guess the device, and gloo-only tests never create a CUDA context.
+    device_id: Optional[torch.device] = None
+    if "nccl" in backend:
+        device_id = torch.device("cuda", process_rank % torch.cuda.device_count())
+        torch.cuda.set_device(device_id)
+
+    return backend, device_id
+
+
 def init_process(
     process_rank: int,
     world_size: int,
@@ -87,16 +113,17 @@ def init_process(
     func: Callable,
     func_args: Optional[Tuple[Any, ...]] = None,
     func_kwargs: Optional[Dict[str, Any]] = None,
-    primary_addr: str = "127.0.0.1",
-    primary_port: int = 29500,
+    init_method: str = "tcp://127.0.0.1:29500",
 ):
     assert world_size > 1
 
+    backend, device_id = _resolve_backend_and_device(backend, process_rank)
+
     old_log_record_factory = logging.getLogRecordFactory()
 
     def log_record_factory(*args, **kwargs) -> logging.LogRecord:
         record = old_log_record_factory(*args, **kwargs)
-        setattr(record, "local_rank", dist.get_rank())
+        setattr(record, "local_rank", process_rank)
         return record
 
     handler = logging.StreamHandler(sys.stderr)
@@ -107,26 +134,31 @@ def init_process(
     )
     logging.setLogRecordFactory(log_record_factory)
 
-    if log_from_all_ranks or process_rank == 0:
-        logging.basicConfig(level=logging.DEBUG, handlers=[handler])
-
     log = logging.getLogger()
+    if log_from_all_ranks or process_rank == 0:
+        # NOTE: attach the handler directly instead of using 'logging.basicConfig()', which is a
+        # no-op when the root logger already has handlers (e.g. inherited from pytest via fork).
+        log.addHandler(handler)
+        log.setLevel(logging.DEBUG)
 
     dist.init_process_group(
         backend=backend,
-        init_method=f"tcp://{primary_addr}:{primary_port}",
+        init_method=init_method,
         world_size=world_size,
         rank=process_rank,
         timeout=datetime.timedelta(seconds=120),
+        device_id=device_id,
     )
 
     os.environ.setdefault(OLMO_NUM_NODES_ENV_VAR, "1")
     os.environ.setdefault(OLMO_LOCAL_WORLD_SIZE_ENV_VAR, str(world_size))
 
-    log.info("Starting test...")
+    # Split the available CPUs between ranks so that their intra-op thread pools don't oversubscribe
+    # the machine.
+    num_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    torch.set_num_threads(max(1, (num_cpus or 1) // world_size))
 
-    if "nccl" in backend:
-        torch.cuda.set_device(int(process_rank))
+    log.info("Starting test...")
 
     try:
         func(*(func_args or []), **(func_kwargs or {}))
@@ -145,13 +177,67 @@ def run_distributed_test(
 ):
     """
     This runs the `func` in a simulated distributed environment.
+
+    .. note::
+        By default gloo tests use the "forkserver" start method and everything else uses "spawn",
+        so ``func`` and its arguments must be picklable.
+
+    .. note::
+        With ``world_size=1`` the test runs in the current process using an in-memory store,
+        which avoids the cost of starting a new process. The test is therefore *not* isolated:
+        any global state it changes (CUDA device, logging, torch settings) leaks into the pytest
+        process, and ``start_method`` and ``log_from_all_ranks`` are ignored.
     """
+    if world_size == 1:
+        _run_single_rank_test(backend, func, func_args=func_args, func_kwargs=func_kwargs)
+        return
+
     if start_method is None:
-        start_method = "fork" if backend == "gloo" else "spawn"
+        start_method = "forkserver" if backend == "gloo" else "spawn"
+
+    # Rendezvous through a file in a fresh temporary directory instead of a fixed TCP port so that
+    # tests running in parallel (e.g. with pytest-xdist) can't collide with each other.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        init_method = f"file://{os.path.join(tmp_dir, 'rendezvous')}"
+        mp.start_processes(
+            init_process,
+            args=(
+                world_size,
+                backend,
+                log_from_all_ranks,
+                func,
+                func_args,
+                func_kwargs,
+                init_method,
+            ),
+            nprocs=world_size,
+            start_method=start_method,
+        )
 
-    mp.start_processes(
-        init_process,
-        args=(world_size, backend, log_from_all_ranks, func, func_args, func_kwargs),
-        nprocs=world_size,
-        start_method=start_method,
-    )
+
+def _run_single_rank_test(
+    backend: str,
+    func: Callable,
+    func_args: Optional[Tuple[Any, ...]] = None,
+    func_kwargs: Optional[Dict[str, Any]] = None,
+):
+    # NOTE: This runs in the pytest process itself, so a process group leaked by a previous test
+    # would silently be reused (or clobbered) here.
+    assert not dist.is_initialized(), "a process group is already initialized"
+
+    backend, device_id = _resolve_backend_and_device(backend, 0)
+
+    env = {OLMO_NUM_NODES_ENV_VAR: "1", OLMO_LOCAL_WORLD_SIZE_ENV_VAR: "1"}
+    with mock.patch.dict(os.environ, env):
+        dist.init_process_group(
+            backend=backend,
+            store=dist.HashStore(),
+            world_size=1,
+            rank=0,
+            timeout=datetime.timedelta(seconds=120),
+            device_id=device_id,
+        )
+        try:
+            func(*(func_args or []), **(func_kwargs or {}))
+        finally:
+            dist.destroy_process_group()
@@ -1,11 +1,12 @@
 from functools import partial
 
 import pytest
+import torch
 import torch.distributed as dist
 
 import olmo_core.distributed.utils as dist_utils
 
-from .utils import BACKENDS, run_distributed_test
+from .utils import BACKENDS, get_default_device, run_distributed_test
 
 
 def scatter_object():
@@ -22,6 +23,19 @@ def test_scatter_object(backend: str):
     run_distributed_test(scatter_object, backend=backend)
 
 
+def all_reduce_single_rank():
+    assert dist.get_world_size() == 1
+    x = torch.tensor([1.0], device=get_default_device())
+    dist.all_reduce(x)
+    assert x.item() == 1.0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_distributed_test_with_single_rank(backend: str):
+    run_distributed_test(all_reduce_single_rank, world_size=1, backend=backend)
+    assert not dist.is_initialized()
+
+
 @pytest.mark.parametrize("n, world_size", [(2, 1), (8, 64)])
 def test_do_n_at_a_time(n: int, world_size: int):
     times_called = 0
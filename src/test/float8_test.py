@@ -0,0 +1,36 @@
+import pytest
+import torch.nn as nn
+
+from olmo_core.exceptions import OLMoConfigurationError
+from olmo_core.float8 import Float8Config
+
+
+def get_model() -> nn.Module:
+    return nn.ModuleDict(
+        {
+            "w1": nn.Linear(32, 32, bias=False),
+            "w2": nn.Linear(32, 32, bias=False),
+            "w3": nn.Linear(32, 32, bias=False),
+        }
+    )
+
+
+def test_convert_to_float8_training_with_modules_to_ignore():
+    float8 = pytest.importorskip("torchao.float8.float8_linear")
+
+    model = get_model()
+    config = Float8Config(modules_to_ignore=["w1"])
+    config.convert_to_float8_training(model, modules_to_ignore={"w2"})
+
+    # Modules ignored by both the config and the caller should be left alone.
+    assert not isinstance(model["w1"], float8.Float8Linear)
+    assert not isinstance(model["w2"], float8.Float8Linear)
+    assert isinstance(model["w3"], float8.Float8Linear)
+
+
+def test_convert_to_float8_training_with_invalid_modules_to_ignore():
+    pytest.importorskip("torchao.float8")
+
+    config = Float8Config(modules_to_ignore=["w4"])
+    with pytest.raises(OLMoConfigurationError, match="w4"):
+        config.convert_to_float8_training(get_model(), modules_to_ignore={"w1"})
@@ -1,18 +1,28 @@
 import logging
+from unittest import mock
 
 import pytest
 import torch
 import torch.nn as nn
+from torch.distributed.algorithms._checkpoint.checkpoint_wrapper import (
+    CheckpointWrapper,
+)
 from torch.distributed.tensor import DTensor, init_device_mesh
 
 from olmo_core.distributed.checkpoint import (
     load_model_and_optim_state,
     save_model_and_optim_state,
 )
-from olmo_core.distributed.parallel import DataParallelType
+from olmo_core.distributed.parallel import DataParallelType, TensorParallelConfig
 from olmo_core.distributed.utils import get_world_size
+from olmo_core.exceptions import OLMoConfigurationError
 from olmo_core.nn.layer_norm import LayerNorm
-from olmo_core.nn.transformer import TransformerConfig, TransformerDataParallelConfig
+from olmo_core.nn.transformer import (
+    TransformerActivationCheckpointingConfig,
+    TransformerActivationCheckpointingMode,
+    TransformerConfig,
+    TransformerDataParallelConfig,
+)
 from olmo_core.utils import get_default_device
 
 from ...distributed.utils import BACKENDS, requires_multi_gpu, run_distributed_test
@@ -53,6 +63,73 @@ def test_small_llama2_builder_config(init_device, device):
     assert model.blocks[-1].block_idx == len(model.blocks) - 1
 
 
+def test_llama_like_layer_norm_configs_are_not_shared():
+    config = TransformerConfig.llama_like(
+        d_model=64, vocab_size=128, n_layers=2, n_heads=4, qk_norm=True, layer_norm_eps=1e-5
+    )
+    assert config.lm_head.layer_norm is not None
+    assert config.block.layer_norm is not None
+    assert config.block.attention.qk_norm is not None
+
+    # Overriding one layer norm shouldn't silently change the others.
+    config.lm_head.layer_norm.eps = 1e-6
+    assert config.block.layer_norm.eps == 1e-5
+    assert config.block.attention.qk_norm.eps == 1e-5
+
+
+def test_selected_blocks_activation_checkpointing_default_interval():
+    n_layers = 9
+    config = TransformerConfig.llama_like(
+        d_model=64,
+        vocab_size=128,
+        n_layers=n_layers,
+        n_heads=4,
+        fused_ops=False,
+        use_flash=False,
+        ac_config=TransformerActivationCheckpointingConfig(
+            mode=TransformerActivationCheckpointingMode.selected_blocks
+        ),
+    )
+    model = config.build(init_device="cpu", device=torch.device("cpu"))
+
+    # Without a 'block_interval' about sqrt(n_layers) blocks should be wrapped.
+    block_interval = round(n_layers**0.5)
+    for block_idx, block in enumerate(model.blocks):
+        assert isinstance(block, CheckpointWrapper) == (block_idx % block_interval == 0)
+
+    # The default shouldn't be written back to the config.
+    assert config.ac_config is not None
+    assert config.ac_config.block_interval is None
+
+
+def test_tensor_parallel_without_mesh_fails_before_building():
+    config = TransformerConfig.llama2_271M(
+        vocab_size=50257, tp_config=TensorParallelConfig(degree=2)
+    )
+    with mock.patch("olmo_core.nn.transformer.config.Transformer") as transformer_cls:
+        with pytest.raises(RuntimeError, match="tp_mesh"):
+            config.build(init_device="cpu", device=torch.device("cpu"))
+    transformer_cls.assert_not_called()
+
+
+def test_tensor_parallel_with_ngpt_fails_before_building():
+    config = TransformerConfig.ngpt_271M(vocab_size=50257, tp_config=TensorParallelConfig(degree=2))
+    with mock.patch("olmo_core.nn.transformer.config.NormalizedTransformer") as transformer_cls:
+        with pytest.raises(OLMoConfigurationError):
+            config.build(init_device="cpu", device=torch.device("cpu"), tp_mesh=mock.MagicMock())
+    transformer_cls.assert_not_called()
+
+
+def test_hsdp_with_1d_mesh_fails_before_building():
+    config = TransformerConfig.llama2_271M(
+        vocab_size=50257, dp_config=TransformerDataParallelConfig(name=DataParallelType.hsdp)
+    )
+    with mock.patch("olmo_core.nn.transformer.config.Transformer") as transformer_cls:
+        with pytest.raises(OLMoConfigurationError, match="HSDP"):
+            config.build(device=torch.device("cpu"), dp_mesh=mock.MagicMock(ndim=1))
+    transformer_cls.assert_not_called()
+
+
 def check_ngpt_matrices(model: nn.Module, d_model: int):
     for name, module in model.named_modules():
         if isinstance(module, nn.Linear):
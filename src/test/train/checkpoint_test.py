@@ -1,5 +1,6 @@
 import os
 import time
+from typing import Any, Iterator
 
 import pytest
 import torch
@@ -9,7 +10,7 @@ from olmo_core.distributed.utils import barrier, get_rank
 from olmo_core.io import dir_is_empty, file_exists, is_url, normalize_path
 from olmo_core.train.checkpoint import Checkpointer
 
-from ..distributed.utils import run_distributed_test
+from ..distributed.utils import requires_gpu, run_distributed_test
 
 
 def run_checkpointer(base_dir, work_dir, model_factory):
@@ -62,13 +63,15 @@ def test_checkpointer_with_remote_dir(s3_checkpoint_dir, tmp_path, tiny_model_fa
     )
 
 
-def run_async_checkpointer(dir, work_dir, model_factory):
+def run_async_checkpointer(dir, work_dir, model_factory, pin_memory=False):
     dir = normalize_path(dir)
 
     if not is_url(dir):
         os.environ["OLMO_SHARED_FS"] = "1"
 
-    checkpointer = Checkpointer(work_dir=work_dir, process_group=dist.new_group())
+    checkpointer = Checkpointer(
+        work_dir=work_dir, process_group=dist.new_group(), pin_memory=pin_memory
+    )
     model = model_factory()
     optim = torch.optim.AdamW(model.parameters())
 
@@ -97,6 +100,60 @@ def test_async_checkpointer_with_local_dir(tmp_path, tiny_model_factory):
     )
 
 
+@requires_gpu
+def test_async_checkpointer_with_pinned_memory(tmp_path, tiny_model_factory):
+    run_distributed_test(
+        run_async_checkpointer,
+        func_args=(tmp_path / "checkpoint", tmp_path / "work_dir", tiny_model_factory, True),
+        start_method="spawn",
+    )
+
+
+def _iter_tensors(state: Any) -> Iterator[torch.Tensor]:
+    if isinstance(state, torch.Tensor):
+        yield state
+    elif isinstance(state, dict):
+        for value in state.values():
+            yield from _iter_tensors(value)
+    elif isinstance(state, (list, tuple)):
+        for value in state:
+            yield from _iter_tensors(value)
+
+
+def run_async_checkpointer_reuses_pinned_memory(base_dir, work_dir, model_factory):
+    os.environ["OLMO_SHARED_FS"] = "1"
+
+    checkpointer = Checkpointer(work_dir=work_dir, process_group=dist.new_group(), pin_memory=True)
+    model = model_factory().cuda()
+    optim = torch.optim.AdamW(model.parameters())
+    model(torch.rand(2, 8, device="cuda")).sum().backward()
+    optim.step()
+
+    data_ptrs = []
+    for step in (1, 2):
+        dir = f"{normalize_path(base_dir)}/{Checkpointer.checkpoint_dirname(step)}"
+        checkpointer.save_async(dir, model, optim, {"rank": get_rank()}).result()
+        barrier()
+
+        assert checkpointer._stager is not None
+        staged_tensors = list(_iter_tensors(checkpointer._stager.state_dict_cache))
+        assert staged_tensors
+        assert all(t.device.type == "cpu" and t.is_pinned() for t in staged_tensors)
+        data_ptrs.append([t.data_ptr() for t in staged_tensors])
+
+    # The same pinned buffer should be reused for every save.
+    assert data_ptrs[0] == data_ptrs[1]
+
+
+@requires_gpu
+def test_async_checkpointer_reuses_pinned_memory(tmp_path, tiny_model_factory):
+    run_distributed_test(
+        run_async_checkpointer_reuses_pinned_memory,
+        func_args=(tmp_path / "checkpoints", tmp_path / "work_dir", tiny_model_factory),
+        start_method="spawn",
+    )
+
+
 def test_async_checkpointer_with_remote_dir(s3_checkpoint_dir, tmp_path, tiny_model_factory):
     from botocore.exceptions import NoCredentialsError
 
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from torch.distributed._composable.fsdp import FSDPModule
+
+from olmo_core.train import Trainer
+
+
+@pytest.mark.parametrize("defer_fsdp_grad_sync", [True, False])
+def test_train_microbatch_context_with_fsdp(defer_fsdp_grad_sync: bool):
+    model = mock.create_autospec(FSDPModule, instance=True)
+    # NOTE: the context only looks at these two attributes, so a full trainer isn't needed.
+    trainer: Trainer = SimpleNamespace(  # type: ignore[assignment]
+        model=model, defer_fsdp_grad_sync=defer_fsdp_grad_sync
+    )
+
+    num_micro_batches = 3
+    for micro_batch_idx in range(num_micro_batches):
+        with Trainer._train_microbatch_context(trainer, micro_batch_idx, num_micro_batches):
+            pass
+
+    if defer_fsdp_grad_sync:
+        # Gradients should only be reduced on the final micro-batch.
+        assert model.set_requires_gradient_sync.call_args_list == [
+            mock.call(False),
+            mock.call(False),
+            mock.call(True),
+        ]
+    else:
+        model.set_requires_gradient_sync.assert_not_called()